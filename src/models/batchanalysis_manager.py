@@ -1,5 +1,6 @@
 import logging
 import traceback
+import plotly.graph_objects as go
 from PySide6.QtCore import QObject, Signal, Slot
 
 from esat.data.analysis import BatchAnalysis
@@ -8,6 +9,15 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def to_webgl(fig):
+    """Return a copy of the figure with its scatter traces drawn as WebGL (Scattergl) traces."""
+    data = [
+        go.Scattergl(trace.to_plotly_json(), skip_invalid=True) if trace.type == "scatter" else trace
+        for trace in fig.data
+    ]
+    return go.Figure(data=data, layout=fig.layout)
+
+
 class BatchAnalysisManager(QObject):
     finished = Signal(object)  # Emitted with results when done
     error = Signal(Exception)  # Emitted with exception on error
@@ -29,7 +39,8 @@ class BatchAnalysisManager(QObject):
             self.analysis = BatchAnalysis(self.batch_sa, self.data_handler)
             self.loss_plot = self.analysis.plot_loss(show=False)
             self.loss_distribution_plot = self.analysis.plot_loss_distribution(show=False)
-            self.temporal_residual_plot = self.analysis.plot_temporal_residuals(feature_idx=0, show=False)
+            # The residual plot holds one trace per model, render it on the GPU rather than as SVG nodes
+            self.temporal_residual_plot = to_webgl(self.analysis.plot_temporal_residuals(feature_idx=0, show=False))
             self.finished.emit(self.analysis)
             logger.info(f"BatchAnalysisManager for {self.name} instance finished successfully.")
         except Exception as e:
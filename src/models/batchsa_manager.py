@@ -1,16 +1,24 @@
+import os
 import uuid
 import sys
 import re
+import json
+import pickle
+import hashlib
 import logging
 import numpy as np
 import multiprocessing as mp
+from multiprocessing.managers import BaseProxy
 import threading
 from functools import partial
+from importlib import metadata
 from typing import List, Optional
 
-from PySide6.QtCore import QObject, Signal, QThread
+from PySide6.QtCore import QObject, Signal, QThread, QStandardPaths
 
+import esat
 from esat.model.batch_sa import BatchSA
+from esat.utils import memory_estimate
 
 
 logging.basicConfig(
@@ -31,12 +39,122 @@ def wrapped_progress_callback(progress_queue, model_i, i, max_iter, qtrue, qrobu
         "completed": completed
     })
 
+BATCH_CACHE_MAX_ENTRIES = 50
+
+
+BATCH_CACHE_APP_DIR = "esat-app"
+
+
+def batch_cache_dir():
+    """
+    Directory holding pickled BatchSA results. The app does not set a QApplication name, which CacheLocation depends
+    on, so an app-specific directory is used under the generic cache location instead.
+    """
+    cache_dir = os.path.join(QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation),
+                             BATCH_CACHE_APP_DIR, "batch_sa")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def _esat_version():
+    """Installed esat version, results from a different version of the algorithm must not be reused."""
+    version = getattr(esat, "__version__", None)
+    if version is None:
+        try:
+            version = metadata.version("esat")
+        except metadata.PackageNotFoundError:
+            version = "unknown"
+    return str(version)
+
+
+def batch_cache_key(V, U, params):
+    """Hash of the input data, uncertainty, batch parameters and esat version, which determine a BatchSA result."""
+    digest = hashlib.sha256()
+    for array in (V, U):
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.shape}{array.dtype}".encode())
+        digest.update(array.tobytes())
+    digest.update(json.dumps({**params, "esat_version": _esat_version()}, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def _strip_progress_hooks(obj):
+    """
+    Clear the progress callbacks and Manager queue proxies held on a BatchSA or SA object. Copies of them come back
+    on every result unpickled from the pool workers, and a pickled proxy would try to reconnect to a Manager that no
+    longer exists when loaded.
+    """
+    for name, value in list(getattr(obj, "__dict__", {}).items()):
+        if isinstance(value, BaseProxy) or ("callback" in name and callable(value)):
+            setattr(obj, name, None)
+
+
+def load_cached_batch(key):
+    """
+    Return the cached entry for the key, a dict with the "batch_sa" and the last "progress" payload of each model,
+    or None on a miss or unreadable entry.
+    """
+    path = os.path.join(batch_cache_dir(), f"{key}.pkl")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            entry = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Unable to read cached batch {path}: {e}")
+        return None
+    if not isinstance(entry, dict) or "batch_sa" not in entry:
+        return None
+    os.utime(path)  # Mark as recently used for eviction
+    return entry
+
+
+def store_cached_batch(key, batch_sa, progress):
+    """
+    Pickle the BatchSA and the last progress payload of each model under the key, then evict the least recently used
+    entries over the limit.
+    """
+    cache_dir = batch_cache_dir()
+    path = os.path.join(cache_dir, f"{key}.pkl")
+    # Training is over, the hooks are not needed on the returned objects either
+    _strip_progress_hooks(batch_sa)
+    for sa in getattr(batch_sa, "results", None) or []:
+        if sa is not None:
+            _strip_progress_hooks(sa)
+    try:
+        with open(f"{path}.tmp", "wb") as f:
+            pickle.dump({"batch_sa": batch_sa, "progress": progress}, f)
+        os.replace(f"{path}.tmp", path)
+    except Exception as e:
+        logger.warning(f"Unable to cache batch {path}: {e}")
+        return
+    entries = sorted(
+        (os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith(".pkl")),
+        key=os.path.getmtime
+    )
+    for stale in entries[:-BATCH_CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(stale)
+        except OSError:
+            pass
+
+
+# Queued after training so the manager can wait until the listener has seen every progress event
+PROGRESS_FLUSH = "flush"
+
+
 # In the main thread:
-def listen_for_progress(progress_queue, progress_signal):
+def listen_for_progress(progress_queue, progress_signal, last_progress=None, flushed=None):
     while True:
         progress_data = progress_queue.get()
         if progress_data is None:
             break
+        if progress_data == PROGRESS_FLUSH:
+            if flushed is not None:
+                flushed.set()
+            continue
+        if last_progress is not None:
+            last_progress[progress_data["model_i"]] = progress_data
         progress_signal.emit(progress_data)
 
 
@@ -64,6 +182,8 @@ class BatchSAManager(QObject):
         self.manager = mp.Manager()  # Create a Manager instance
         self.progress_queue = self.manager.Queue()  # Use Manager's Queue
         self.listener_thread = None
+        self.last_progress = {}  # model_i: last progress payload, cached with the results
+        self.progress_flushed = threading.Event()
         self.dataset_name = dataset_name
         self.batch_sa = None
 
@@ -96,7 +216,7 @@ class BatchSAManager(QObject):
     def start_batch_sa_in_thread(self):
         self.listener_thread = threading.Thread(
             target=listen_for_progress,
-            args=(self.progress_queue, self.progress),
+            args=(self.progress_queue, self.progress, self.last_progress, self.progress_flushed),
             daemon=True
         )
         self.listener_thread.start()
@@ -112,20 +232,69 @@ class BatchSAManager(QObject):
         # Start the thread
         self.batch_sa_thread.start()
 
+    def _pool_size(self):
+        """
+        Number of worker processes for the BatchSA pool: esat's memory based default (75% of the cores the data
+        fits in memory for), capped at the number of models so no idle workers are spawned.
+        """
+        system_options = memory_estimate(self.V.shape[1], self.V.shape[0], self.factors)
+        return max(min(self.models, int(system_options["max_cores"] * 0.75)), 1)
+
+    def _cache_key(self):
+        params = {
+            "factors": self.factors, "models": self.models, "method": self.method, "seed": self.seed,
+            "max_iter": self.max_iter, "init_method": self.init_method, "init_norm": self.init_norm,
+            "converge_delta": self.converge_delta, "converge_n": self.converge_n
+        }
+        return batch_cache_key(self.V, self.U, params)
+
+    def _replay_progress(self, entry):
+        """
+        Replay the last progress payload of every model of a cached batch so the progress table fills in exactly as
+        it did for the original run.
+        """
+        progress = entry.get("progress") or {}
+        # Every model index gets a completed event, otherwise the batch would never be reported as finished
+        for model_i in range(1, self.models + 1):
+            payload = progress.get(model_i)
+            if payload is None:
+                payload = {"model_i": model_i, "i": self.max_iter, "max_iter": self.max_iter, "qtrue": float("nan"),
+                           "qrobust": float("nan"), "mse": float("nan")}
+            self.progress_queue.put({**payload, "completed": True})
+
+    def _wait_for_progress(self, timeout=10):
+        """Block until the listener has processed every progress event queued so far, False on timeout."""
+        self.progress_flushed.clear()
+        self.progress_queue.put(PROGRESS_FLUSH)
+        if not self.progress_flushed.wait(timeout):
+            logger.warning(f"BatchSA {self.id} progress listener did not drain within {timeout}s, not caching")
+            return False
+        return True
+
     def run(self):
         try:
             logger.info(f"Starting BatchSA {self.id}")
-            progress_cb = partial(
-                wrapped_progress_callback,
-                self.progress_queue
-            )
-            batch_sa = BatchSA(
-                V=self.V, U=self.U, factors=self.factors, models=self.models, seed=self.seed,
-                method=self.method, max_iter=self.max_iter, init_method=self.init_method,
-                init_norm=self.init_norm, converge_delta=self.converge_delta,
-                converge_n=self.converge_n, verbose=False, progress_callback=progress_cb
-            )
-            _ = batch_sa.train()
+            cache_key = self._cache_key()
+            entry = load_cached_batch(cache_key)
+            if entry is not None:
+                logger.info(f"BatchSA {self.id} loaded from cache: {cache_key}")
+                batch_sa = entry["batch_sa"]
+                self._replay_progress(entry)
+            else:
+                progress_cb = partial(
+                    wrapped_progress_callback,
+                    self.progress_queue
+                )
+                batch_sa = BatchSA(
+                    V=self.V, U=self.U, factors=self.factors, models=self.models, seed=self.seed,
+                    method=self.method, max_iter=self.max_iter, init_method=self.init_method,
+                    init_norm=self.init_norm, converge_delta=self.converge_delta,
+                    converge_n=self.converge_n, parallel=True, cores=self._pool_size(), verbose=False,
+                    progress_callback=progress_cb
+                )
+                _ = batch_sa.train()
+                if self._wait_for_progress() and len(self.last_progress) == self.models:
+                    store_cached_batch(cache_key, batch_sa, dict(self.last_progress))
             logger.info(f"BatchSA {self.id} completed successfully.")
             self.batch_sa = batch_sa
             self.finished.emit("BatchSA", batch_sa)
@@ -1,3 +1,4 @@
 from .info_dialog import InfoDialog
 from .loader import create_loader, toggle_loader
-from .plot_container import create_plot_container
\ No newline at end of file
+from .plot_container import create_plot_container
+from .html_render import HtmlRenderTask
\ No newline at end of file
@@ -0,0 +1,36 @@
+import logging
+import traceback
+
+import plotly.io as pio
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+logger = logging.getLogger(__name__)
+
+
+class HtmlRenderSignals(QObject):
+    finished = Signal(str)
+
+
+class HtmlRenderTask(QRunnable):
+    """Render a plotly figure to HTML on a QThreadPool worker.
+
+    The figure is snapshotted to a plain dict on construction (GUI thread) so the worker never touches a figure that
+    the GUI may still be mutating. The dict is already validated, so the worker renders it without re-validating.
+    The result is delivered to ``on_done`` through a queued signal, an empty string means rendering failed.
+    """
+
+    def __init__(self, fig, on_done=None, **to_html_kwargs):
+        super().__init__()
+        self.fig_dict = fig.to_dict()
+        self.to_html_kwargs = to_html_kwargs
+        self.signals = HtmlRenderSignals()
+        if on_done is not None:
+            self.signals.finished.connect(on_done)
+
+    def run(self):
+        try:
+            html = pio.to_html(self.fig_dict, validate=False, **self.to_html_kwargs)
+        except Exception:
+            logger.error(traceback.format_exc())
+            html = ""
+        self.signals.finished.emit(html)
@@ -94,7 +94,8 @@ class DataView(QWidget):
     def _connect_signals(self):
         if self.controller and hasattr(self.controller.main_controller, "dataset_manager"):
             dataset_manager = self.controller.main_controller.dataset_manager
-            dataset_manager.datasets_changed.connect(self._check_dataset_removed)
+            # The selection widget rebuilds its dropdown on a deferred timer, check against the rebuilt list
+            self.dataset_selection_widget.dropdown_updated.connect(self._check_dataset_removed)
             dataset_manager.dataset_loaded.connect(self.on_dataset_loaded)
 
             dataset_manager.uncertainty_plot_ready.connect(self.update_scatter_plot)
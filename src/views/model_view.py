@@ -10,7 +10,6 @@ from src.widgets.dataset_selection_widget import DatasetSelectionWidget
 from src.views.tabs.mv_batchrun_tab import BatchRunTab
 from src.views.tabs.mv_batchanalysis_tab import BatchAnalysisTab
 from src.views.tabs.mv_model_analysis_tab import ModelAnalysisTab
-from src.views.tabs.ma_featureanalysis_stab import FeatureAnalysisSubTab
 
 logging.basicConfig(
     level=logging.INFO,
@@ -104,10 +103,11 @@ class ModelView(QWidget):
         self.controller.main_controller.modelstats_finished.connect(self._update_modelanalysis_tab)
         self.controller.main_controller.modelresiduals_finished.connect(self._update_residualanalysis_tab)
 
-        self.controller.main_controller.factor_profile_contrib_finished.connect(self.modelanalysis_tab.factor_analysis_tab.refresh_profile_plot)
-        self.controller.main_controller.factor_fingerprints_finished.connect(self.modelanalysis_tab.factor_analysis_tab.refresh_fingerprints_plot)
-        self.controller.main_controller.factor_gplot_finished.connect(self.modelanalysis_tab.factor_analysis_tab.refresh_g_plot)
+        self.controller.main_controller.factor_profile_contrib_finished.connect(self._refresh_factor_profile_plot)
+        self.controller.main_controller.factor_fingerprints_finished.connect(self._refresh_factor_fingerprints_plot)
+        self.controller.main_controller.factor_gplot_finished.connect(self._refresh_factor_g_plot)
 
+        self.controller.main_controller.batchanalysis_finished.connect(self._update_batchanalysis_tab)
         self.controller.main_controller.batchanalysis_finished.connect(self._update_factoranalysis_tab)
 
         self.controller.main_controller.modelstats_finished.connect(self._update_factorsummary_table)
@@ -283,37 +283,6 @@ class ModelView(QWidget):
         self.batchanalysis_tab.reattach_webviews()
         self.modelanalysis_tab.reattach_webviews()
 
-    def _setup_modelanalysis_tab(self):
-        self.modelanalysis_tab = QWidget()
-        layout = QVBoxLayout(self.modelanalysis_tab)
-
-        # Create subtabs
-        self.modelanalysis_subtabs = QTabWidget()
-        self.modelanalysis_subtabs.setTabPosition(QTabWidget.South)  # Tabs at the top
-
-        # Add subtabs with placeholders
-        self.feature_analysis_tab = FeatureAnalysisSubTab(parent=self, controller=self.controller)
-
-        self.residual_analysis_tab = QWidget()
-        self.residual_analysis_tab.setLayout(QVBoxLayout())
-        self.residual_analysis_tab.layout().addWidget(QLabel("Residual Analysis Content"))
-
-        self.factor_analysis_tab_sub = QWidget()
-        self.factor_analysis_tab_sub.setLayout(QVBoxLayout())
-        self.factor_analysis_tab_sub.layout().addWidget(QLabel("Factor Analysis Content"))
-
-        self.factor_summary_tab = QWidget()
-        self.factor_summary_tab.setLayout(QVBoxLayout())
-        self.factor_summary_tab.layout().addWidget(QLabel("Factor Summary Content"))
-
-        self.modelanalysis_subtabs.addTab(self.feature_analysis_tab, "Feature Analysis")
-        self.modelanalysis_subtabs.addTab(self.residual_analysis_tab, "Residual Analysis")
-        self.modelanalysis_subtabs.addTab(self.factor_analysis_tab_sub, "Factor Analysis")
-        self.modelanalysis_subtabs.addTab(self.factor_summary_tab, "Factor Summary")
-
-        layout.addWidget(self.modelanalysis_subtabs)
-        return self.modelanalysis_tab
-
     def _setup_factorcatalog_tab(self):
         self.factoranalysis_tab = QWidget()
         self.factoranalysis_layout = QVBoxLayout(self.factoranalysis_tab)
@@ -344,6 +313,16 @@ class ModelView(QWidget):
             n_factors = manager.sa.factors
             self.modelanalysis_tab.factor_analysis_tab.populate_factors(list(range(1, n_factors + 1)))
 
+    # The factor analysis subtab is built lazily, so resolve it when the signal fires rather than at connect time
+    def _refresh_factor_profile_plot(self, *args):
+        self.modelanalysis_tab.factor_analysis_tab.refresh_profile_plot()
+
+    def _refresh_factor_fingerprints_plot(self, *args):
+        self.modelanalysis_tab.factor_analysis_tab.refresh_fingerprints_plot()
+
+    def _refresh_factor_g_plot(self, *args):
+        self.modelanalysis_tab.factor_analysis_tab.refresh_g_plot()
+
     def _update_factorsummary_table(self):
         logger.info(f"[ModelView] Updating Factor Summary table with new data")
         self.modelanalysis_tab.factor_summary_tab.update_table()
@@ -1,11 +1,17 @@
 import logging
+import weakref
+import zlib
+import numpy as np
+from PySide6.QtCore import QThreadPool, QSignalBlocker
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLabel, QSizePolicy, QApplication
 
-from src.utils import create_loader, toggle_loader, create_plot_container
+from src.utils import create_loader, toggle_loader, create_plot_container, HtmlRenderTask
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+_PLOT_CONFIG = {'responsive': True, 'displayModeBar': 'hover'}
+
 
 class BatchAnalysisTab(QWidget):
     def __init__(self, parent=None, controller=None, webviews=None):
@@ -14,6 +20,11 @@ class BatchAnalysisTab(QWidget):
         self.controller = controller
         self.webviews = webviews or {}
         self._webview_html_cache = {}
+        # dataset_name: (weakref to batchanalysis_manager, zlib-compressed base residual html)
+        self._residual_html_cache = {}
+        self._residual_render_seq = 0
+        self._feature_changed_slot = None  # The feature dropdown handler for the current selection
+        self._ctx = {}  # Cached selection context, see _context()
 
         self.batchloss_loading, self.batchloss_movie = create_loader()
         self.batchdist_loading, self.batchdist_movie = create_loader()
@@ -25,6 +36,10 @@ class BatchAnalysisTab(QWidget):
         self.feature_dropdown = QComboBox()
         self._setup_ui()
 
+        if self.controller and hasattr(self.controller, "main_controller"):
+            self.controller.main_controller.batchanalysis_finished.connect(self._invalidate_context)
+            self.controller.main_controller.dataset_manager.datasets_changed.connect(self._invalidate_context)
+
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         # --- Top row: Two plots ---
@@ -49,18 +64,38 @@ class BatchAnalysisTab(QWidget):
         layout.addLayout(bottom_row)
         self.plot_stacks = [self.loss_stack, self.dist_stack, self.residual_stack]
 
+    @property
+    def _current_dataset(self):
+        return self.parent.dataset_selection_widget.selected_dataset
+
+    def _context(self):
+        """
+        Return the cached batch manager and feature list for the selected dataset, rebuilding them only when the
+        selection changes or the context was invalidated.
+        """
+        dataset_name = self._current_dataset
+        if not self._ctx or self._ctx['dataset'] != dataset_name:
+            batch_analysis_dict = getattr(self.controller.main_controller, "batch_analysis_dict", {})
+            batchanalysis_manager = batch_analysis_dict.get(dataset_name) if dataset_name else None
+            feature_list = None
+            if batchanalysis_manager is not None:
+                feature_list = self.controller.main_controller.dataset_manager.loaded_datasets[dataset_name].input_data_df.columns.tolist()
+            self._ctx = {'dataset': dataset_name, 'batch_manager': batchanalysis_manager, 'feature_list': feature_list}
+        return self._ctx
+
+    def _invalidate_context(self, *args):
+        self._ctx = {}
+
     def update_batchloss_plot(self, html=None):
         toggle_loader(self.loss_stack, self.batchloss_movie, True)
         if html is None and self.parent:
-            dataset_name = self.parent.dataset_selection_widget.selected_dataset
-            batch_analysis_dict = getattr(self.controller.main_controller, "batch_analysis_dict", {})
-            if not batch_analysis_dict or dataset_name not in batch_analysis_dict:
+            batchanalysis_manager = self._context()['batch_manager']
+            if batchanalysis_manager is None:
                 html = ""
             else:
-                batchanalysis_manager = batch_analysis_dict[dataset_name]
                 fig = batchanalysis_manager.loss_plot
                 fig.update_layout(title=dict(font=dict(size=14), x=0.5, xanchor="center"), width=None, height=None, autosize=True, margin=dict(l=5, r=5, t=30, b=5))
-                html = fig.to_html(full_html=False, include_plotlyjs='cdn', config={'responsive': True, 'displayModeBar': 'hover'})
+                html = fig.to_html(full_html=False, include_plotlyjs='cdn', config=_PLOT_CONFIG)
         def hide_spinner(_ok):
             toggle_loader(self.loss_stack, self.batchloss_movie, False)
             try:
@@ -73,15 +108,13 @@ class BatchAnalysisTab(QWidget):
     def update_batchdist_plot(self, html=None):
         toggle_loader(self.dist_stack, self.batchdist_movie, True)
         if html is None and self.parent:
-            dataset_name = self.parent.dataset_selection_widget.selected_dataset
-            batch_analysis_dict = getattr(self.controller.main_controller, "batch_analysis_dict", {})
-            if not batch_analysis_dict or dataset_name not in batch_analysis_dict:
+            batchanalysis_manager = self._context()['batch_manager']
+            if batchanalysis_manager is None:
                 html = ""
             else:
-                batchanalysis_manager = batch_analysis_dict[dataset_name]
                 fig = batchanalysis_manager.loss_distribution_plot
                 fig.update_layout(title=dict(font=dict(size=14), x=0.5, xanchor="center"), width=None, height=None, autosize=True, margin=dict(l=5, r=5, t=30, b=5))
-                html = fig.to_html(full_html=False, include_plotlyjs='cdn', config={'responsive': True, 'displayModeBar': 'hover'})
+                html = fig.to_html(full_html=False, include_plotlyjs='cdn', config=_PLOT_CONFIG)
         def hide_spinner(_ok):
             toggle_loader(self.dist_stack, self.batchdist_movie, False)
             try:
@@ -93,20 +126,32 @@ class BatchAnalysisTab(QWidget):
 
     def update_batchresiduals_plot(self, html=None):
         toggle_loader(self.residual_stack, self.batchresiduals_movie, True)
+        self._residual_render_seq += 1  # Drop any in-flight render for the previous selection
         if html is None and self.parent:
-            dataset_name = self.parent.dataset_selection_widget.selected_dataset
-            batch_analysis_dict = getattr(self.controller.main_controller, "batch_analysis_dict", {})
-            if not batch_analysis_dict or dataset_name not in batch_analysis_dict:
+            ctx = self._context()
+            dataset_name = ctx['dataset']
+            batchanalysis_manager = ctx['batch_manager']
+            if batchanalysis_manager is None:
                 html = ""
             else:
-                feature_list = self.controller.main_controller.dataset_manager.loaded_datasets[dataset_name].input_data_df.columns.tolist() if dataset_name else None
-                self.feature_dropdown.clear()
-                self.feature_dropdown.addItems(feature_list)
-                batchanalysis_manager = batch_analysis_dict[dataset_name]
+                feature_list = ctx['feature_list']
+                # Drop the handler bound to the previous selection's figure and repopulate silently, so no stale
+                # handler starts a render that would land after (and overwrite) this selection's plot
+                if self._feature_changed_slot is not None:
+                    self.feature_dropdown.currentIndexChanged.disconnect(self._feature_changed_slot)
+                    self._feature_changed_slot = None
+                with QSignalBlocker(self.feature_dropdown):
+                    self.feature_dropdown.clear()
+                    self.feature_dropdown.addItems(feature_list)
                 if feature_list:
                     fig = batchanalysis_manager.temporal_residual_plot
                     fig.update_layout(title=dict(font=dict(size=14), x=0.5, xanchor="center", text=f"Model Residual - Feature {feature_list[0]}"), width=None, height=None, autosize=True, margin=dict(l=5, r=5, t=30, b=5))
-                    html = fig.to_html(full_html=False, include_plotlyjs='cdn', config={'responsive': True, 'displayModeBar': 'hover'})
+                    cached = self._residual_html_cache.get(dataset_name)
+                    if cached and cached[0]() is batchanalysis_manager:
+                        html = zlib.decompress(cached[1]).decode('utf-8')
+                    else:
+                        html = None
+                        self._render_residuals_html(fig, cache_key=(dataset_name, batchanalysis_manager))
                     def on_feature_changed(index):
                         toggle_loader(self.residual_stack, self.batchresiduals_movie, True)
                         feature = feature_list[index] if index >= 0 else None
@@ -114,6 +159,9 @@ class BatchAnalysisTab(QWidget):
                             return
                         V_primes = batchanalysis_manager.analysis.aggregated_output
                         input_y = batchanalysis_manager.data_handler.input_data_plot[feature]
+                        iy = input_y.to_numpy(dtype=np.float64, copy=False)
+                        # One (models x samples) buffer per feature change, each trace takes a row
+                        residuals = np.empty((max(len(fig.data) - 1, 0), iy.shape[0]), dtype=np.float64)
                         for i, trace in enumerate(fig.data):
                             if i == 0:
                                 trace.visible = True
@@ -122,17 +170,18 @@ class BatchAnalysisTab(QWidget):
                             if feature in model_v_prime:
                                 model_y = model_v_prime[feature]
                                 if len(input_y) == len(model_y):
-                                    trace.y = input_y.values - model_y.values
+                                    np.subtract(iy, model_y.to_numpy(dtype=np.float64, copy=False), out=residuals[i - 1])
+                                    trace.y = residuals[i - 1]
                                 else:
                                     trace.y = [None] * len(input_y)
                             trace.visible = True
                             trace.name = f"Model {i} - {feature}"
                         fig.update_layout(
                             title=dict(x=0.5, xanchor="center", text=f"Model Residual - Feature {feature}"))
-                        plot_html = fig.to_html(full_html=False, include_plotlyjs='cdn', config={'responsive': True, 'displayModeBar': 'hover'})
                         self.webviews['batchresiduals'].loadFinished.connect(hide_spinner)
-                        self.webviews['batchresiduals'].setHtml(plot_html)
+                        self._render_residuals_html(fig)
                     self.feature_dropdown.currentIndexChanged.connect(on_feature_changed)
+                    self._feature_changed_slot = on_feature_changed
         def hide_spinner(_ok):
             toggle_loader(self.residual_stack, self.batchresiduals_movie, False)
             try:
@@ -142,6 +191,34 @@ class BatchAnalysisTab(QWidget):
         self.webviews['batchresiduals'].loadFinished.connect(hide_spinner)
         self.set_webview_html(view_name='batchresiduals', html=html)
 
+    def _render_residuals_html(self, fig, cache_key=None):
+        """Render the residual figure off the GUI thread, optionally caching the result as the dataset's base HTML."""
+        self._residual_render_seq += 1
+        seq = self._residual_render_seq
+        task = HtmlRenderTask(
+            fig,
+            on_done=lambda html: self._on_residuals_html_ready(seq, cache_key, html),
+            full_html=False, include_plotlyjs='cdn', config=_PLOT_CONFIG
+        )
+        QThreadPool.globalInstance().start(task)
+
+    def _on_residuals_html_ready(self, seq, cache_key, html):
+        if cache_key is not None and html:
+            dataset_name, batchanalysis_manager = cache_key
+            # Weak so a replaced manager is not kept alive by the cache, compressed like _webview_html_cache
+            self._residual_html_cache[dataset_name] = (
+                weakref.ref(batchanalysis_manager), zlib.compress(html.encode('utf-8'), level=1)
+            )
+        if seq != self._residual_render_seq:
+            # A newer render was requested while this one was running
+            return
+        if not html:
+            # Rendering failed: no page load follows, so loadFinished would never hide the spinner
+            logger.warning("Batch residual plot rendering failed, keeping the previous plot")
+            toggle_loader(self.residual_stack, self.batchresiduals_movie, False)
+            return
+        self.set_webview_html(view_name='batchresiduals', html=html)
+
     def update_all(self):
         self.update_batchloss_plot()
         self.update_batchdist_plot()
@@ -152,7 +229,13 @@ class BatchAnalysisTab(QWidget):
         if view_name in self.webviews.keys() and html:
             logger.info(f"Setting HTML for webview: {view_name}")
             self.webviews[view_name].setHtml(html)
-            self._webview_html_cache[view_name] = html
+            # Plotly HTML is mostly embedded JSON, level 1 keeps this cheap while shrinking it several times over
+            self._webview_html_cache[view_name] = zlib.compress(html.encode('utf-8'), level=1)
+
+    def _cached_html(self, view_name):
+        """Return the decompressed cached HTML for the given webview name, or None."""
+        raw = self._webview_html_cache.get(view_name)
+        return zlib.decompress(raw).decode('utf-8') if raw else None
 
     def reattach_webviews(self):
         """
@@ -160,7 +243,6 @@ class BatchAnalysisTab(QWidget):
         """
         # Detach all webviews
         for view_name, webview in self.webviews.items():
-            webview.setHtml("")  # Clear content
             webview.setParent(None)
             webview.setMinimumSize(400, 400)
             webview.setMaximumSize(16777215, 16777215)
@@ -193,8 +275,11 @@ class BatchAnalysisTab(QWidget):
             webview.updateGeometry()
             QApplication.processEvents()
 
-            # Restore cached HTML
-            html = self._webview_html_cache.get(view_name)
+            # Restore cached HTML. The webviews are shared with other views, so only clear them when there is
+            # nothing cached to replace their content with; clearing first would cost an extra navigation.
+            html = self._cached_html(view_name)
+            if not html:
+                webview.setHtml("")
             if view_name == "batchloss":
                 self.update_batchloss_plot(html)
             elif view_name == "batchdist":
@@ -1,38 +1,95 @@
-import time
 import logging
+import collections
 import numpy as np
 
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, QSignalBlocker
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QGroupBox, QFormLayout, QLineEdit, QComboBox,
                                QPushButton, QTableWidget, QProgressBar, QLabel, QSizePolicy, QHeaderView,
-                               QTableWidgetItem, QMessageBox, QApplication)
+                               QTableWidgetItem, QMessageBox)
 from PySide6.QtGui import QIntValidator, QDoubleValidator
 
 from src.widgets.dataset_selection_widget import DatasetSelectionWidget
-from src.widgets.hoverable_table import HoverableTableWidget, BestRowDelegate
+from src.widgets.hoverable_table import HoverableTableWidget, BestRowDelegate, ProgressDelegate
 from src.utils import InfoDialog
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+# Shared by every BatchRunTab, QLineEdit does not take ownership of its validator
+_INT_VALIDATOR = QIntValidator(1, 999999)
+_INT_VALIDATOR_0 = QIntValidator(0, 999999)
+_DOUBLE_VALIDATOR = QDoubleValidator(0.0, 1.0, 4)
+
 
 class BatchRunTab(QWidget):
     all_models_completed = Signal()
 
+    RUN_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #4CAF50;
+            color: white;
+            font-size: 13px;
+            border: none;
+            border-radius: 4px;
+            padding: 4px 10px;
+            min-width: 60px;
+        }
+        QPushButton:hover {
+            background-color: #388E3C;
+            box-shadow: 0 0 6px #A5D6A7;
+        }
+    """
+    CANCEL_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #F44336;
+            color: white;
+            font-size: 13px;
+            border: none;
+            border-radius: 4px;
+            padding: 4px 10px;
+            min-width: 60px;
+        }
+        QPushButton:hover {
+            background-color: #B71C1C;
+            box-shadow: 0 0 6px #FFCDD2;
+        }
+    """
+
     def __init__(self, parent=None, controller=None):
         super().__init__(parent)
         self.parent = parent
         self.controller = controller
-        self._active_row_animations = []
         self.model_progress_widgets = {}
         self._progress_update_counter = {}
-        self._last_update_time = {}
         self._batch_completed = False
+        # Progress events queued from the BatchSA listener thread, drained into the table by the flush timer
+        self._progress_queue = collections.deque()
+        # Per-model iteration count and completion state, indexed by model_i - 1
+        self._progress = np.zeros(0, dtype=np.int32)
+        self._completed = np.zeros(0, dtype=bool)
+        self._qtrue = np.zeros(0, dtype=np.float64)
+        self._qrobust = np.zeros(0, dtype=np.float64)
+        self._mse = np.zeros(0, dtype=np.float64)
+        self._max_iter = 1
+        self._total_models = 0
+        self._last_overall_pct = -1
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(33)  # ~30 Hz
+        self._flush_timer.timeout.connect(self._flush_pending)
 
         self.dataset_selection_widget = DatasetSelectionWidget(controller=self.controller)
 
         self._setup_ui()
+        self._connect_signals()
+
+    def _connect_signals(self):
+        # Connected once here, connecting per batch run made every handler run once per previous run
         self.run_button.clicked.connect(self._on_run_batch_model)
+        self.basemodel_progress_table.rowClicked.connect(self.on_row_clicked)
+        self.basemodel_progress_table.rowDoubleClicked.connect(self.on_row_doubleclicked)
+        self.all_models_completed.connect(self._on_all_models_completed)
+        # Run the batch analysis for the dataset once its BatchSA has finished
+        self.controller.main_controller.batchsa_finished.connect(self.controller.main_controller.run_batch_analysis)
 
     def _setup_ui(self):
         main_layout = QHBoxLayout(self)
@@ -43,21 +100,20 @@ class BatchRunTab(QWidget):
         left_layout = QVBoxLayout(left_panel)
 
         form_layout = QFormLayout()
-        int_validator = QIntValidator(1, 999999)
         # Number of Models
         self.num_models_edit = QLineEdit("20")
-        self.num_models_edit.setValidator(int_validator)
+        self.num_models_edit.setValidator(_INT_VALIDATOR)
         self.num_models_edit.setPlaceholderText("e.g. 20")
         form_layout.addRow("Number of Models", self.num_models_edit)
         # Number of Factors
         self.num_factors_edit = QLineEdit("6")
-        self.num_factors_edit.setValidator(int_validator)
+        self.num_factors_edit.setValidator(_INT_VALIDATOR)
         self.num_factors_edit.setPlaceholderText("e.g. 5")
         form_layout.addRow("Number of Factors", self.num_factors_edit)
         # Optional Random Seed
         seed = np.random.randint(0, 999999)
         self.random_seed_edit = QLineEdit()
-        self.random_seed_edit.setValidator(QIntValidator(0, 999999))
+        self.random_seed_edit.setValidator(_INT_VALIDATOR_0)
         self.random_seed_edit.setPlaceholderText(str(seed))
         form_layout.addRow("Random Seed", self.random_seed_edit)
         # Algorithm selection
@@ -68,36 +124,22 @@ class BatchRunTab(QWidget):
         converge_group = QGroupBox("Converge Criteria")
         converge_layout = QFormLayout(converge_group)
         self.max_iterations_edit = QLineEdit()
-        self.max_iterations_edit.setValidator(int_validator)
+        self.max_iterations_edit.setValidator(_INT_VALIDATOR)
         self.max_iterations_edit.setText("20000")
         converge_layout.addRow("Max Iterations", self.max_iterations_edit)
         self.loss_delta_edit = QLineEdit()
-        self.loss_delta_edit.setValidator(QDoubleValidator(0.0, 1.0, 4))
+        self.loss_delta_edit.setValidator(_DOUBLE_VALIDATOR)
         self.loss_delta_edit.setText("0.1")
         converge_layout.addRow("Loss Delta", self.loss_delta_edit)
         self.iterations_edit = QLineEdit()
-        self.iterations_edit.setValidator(int_validator)
+        self.iterations_edit.setValidator(_INT_VALIDATOR)
         self.iterations_edit.setText("25")
         converge_layout.addRow("Iterations", self.iterations_edit)
         left_layout.addLayout(form_layout)
         left_layout.addWidget(converge_group)
         # Run button
         self.run_button = QPushButton("Run")
-        self.run_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-size: 13px;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 10px;
-                min-width: 60px;
-            }
-            QPushButton:hover {
-                background-color: #388E3C;
-                box-shadow: 0 0 6px #A5D6A7;
-            }
-        """)
+        self.run_button.setStyleSheet(self.RUN_BUTTON_STYLE)
         left_layout.addWidget(self.run_button)
         left_layout.addStretch()
 
@@ -105,7 +147,6 @@ class BatchRunTab(QWidget):
         right_panel = QGroupBox("Model Details")
         right_layout = QVBoxLayout(right_panel)
         self.basemodel_progress_table = HoverableTableWidget()
-        self.basemodel_progress_table.setSortingEnabled(True)
         self.basemodel_progress_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.basemodel_progress_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.basemodel_progress_table.setShowGrid(False)
@@ -122,6 +163,7 @@ class BatchRunTab(QWidget):
         self.basemodel_progress_table.setHorizontalHeaderLabels(["Model", "Progress", "Q(True)", "Q(Robust)", "MSE", "Converged"])
         self.basemodel_progress_table.horizontalHeader().setStretchLastSection(True)
         self.basemodel_progress_table.verticalHeader().setDefaultAlignment(Qt.AlignCenter)
+        self.progress_delegate = ProgressDelegate(parent=self.basemodel_progress_table)
         right_layout.addWidget(self.basemodel_progress_table, stretch=1)
         self.overall_progress_bar = QProgressBar()
         self.overall_progress_bar.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
@@ -138,7 +180,6 @@ class BatchRunTab(QWidget):
 
         self.info_dialog = InfoDialog("Setting up batch model runs...", self)
         self.info_dialog.show()
-        QApplication.processEvents()
         self._set_cancel_button()
 
         logger.info("Starting batch model run")
@@ -165,33 +206,21 @@ class BatchRunTab(QWidget):
         iterations_text = self.iterations_edit.text()
         iterations = int(iterations_text) if iterations_text.isdigit() else None
 
+        self.basemodel_progress_table.blockSignals(True)
+        self.progress_delegate.maximum = max_iterations if max_iterations else 1
+        self.basemodel_progress_table.setItemDelegateForColumn(1, self.progress_delegate)
         self.basemodel_progress_table.setRowCount(0)
+        self.basemodel_progress_table.setRowCount(num_models or 0)
         self.model_progress_widgets.clear()
         for model_i in range(1, (num_models or 0)+1):
-            row = self.basemodel_progress_table.rowCount()
-            self.basemodel_progress_table.insertRow(row)
+            row = model_i - 1
             label = QTableWidgetItem(f"Model {model_i}")
             label.setTextAlignment(Qt.AlignCenter)
             label.setFlags(label.flags() & ~Qt.ItemIsEditable)
-            progress_bar = QProgressBar()
-            progress_bar.setStyleSheet("""
-                QProgressBar {
-                    min-height: 10px;
-                    max-height: 10px;
-                    font-size: 12px;
-                    text-align: right;
-                }
-                QProgressBar::chunk {
-                    background-color: #2196F3;
-                }
-            """)
-            progress_bar.setMaximum(max_iterations if max_iterations else 1)
-            progress_bar.setValue(0)
-            progress_widget = QWidget()
-            progress_layout = QHBoxLayout(progress_widget)
-            progress_layout.setContentsMargins(0, 0, 0, 0)
-            progress_layout.setAlignment(Qt.AlignVCenter)
-            progress_layout.addWidget(progress_bar)
+            # Drawn by progress_delegate from the iteration count in UserRole
+            progress_item = QTableWidgetItem()
+            progress_item.setFlags(progress_item.flags() & ~Qt.ItemIsEditable)
+            progress_item.setData(Qt.UserRole, 0)
             qtrue_item = QTableWidgetItem("0.0000")
             qtrue_item.setFlags(qtrue_item.flags() & ~Qt.ItemIsEditable)
             qrobust_item = QTableWidgetItem("0.0000")
@@ -204,12 +233,22 @@ class BatchRunTab(QWidget):
             converged_label.setTextAlignment(Qt.AlignCenter)
             converged_label.setFlags(label.flags() & ~Qt.ItemIsEditable)
             self.basemodel_progress_table.setItem(row, 0, label)
-            self.basemodel_progress_table.setCellWidget(row, 1, progress_widget)
+            self.basemodel_progress_table.setItem(row, 1, progress_item)
             self.basemodel_progress_table.setItem(row, 2, qtrue_item)
             self.basemodel_progress_table.setItem(row, 3, qrobust_item)
             self.basemodel_progress_table.setItem(row, 4, mse_item)
             self.basemodel_progress_table.setItem(row, 5, converged_label)
-            self.model_progress_widgets[model_i] = (progress_bar, row, converged_label)
+            # The last list holds the text currently shown in the Q(True), Q(Robust) and MSE cells
+            self.model_progress_widgets[model_i] = (progress_item, row, converged_label, qtrue_item, qrobust_item,
+                                                    mse_item, ["0.0000", "0.0000", "0.0000"])
+        self.basemodel_progress_table.blockSignals(False)
+        self._progress = np.zeros(num_models or 0, dtype=np.int32)
+        self._completed = np.zeros(num_models or 0, dtype=bool)
+        self._qtrue = np.full(num_models or 0, np.nan, dtype=np.float64)
+        self._qrobust = np.full(num_models or 0, np.nan, dtype=np.float64)
+        self._mse = np.full(num_models or 0, np.nan, dtype=np.float64)
+        self._max_iter = max_iterations if max_iterations else 1
+        self._total_models = num_models or 0
 
         self.overall_progress_bar.setFixedHeight(20)
         self.overall_progress_bar.setStyleSheet("""
@@ -232,6 +271,7 @@ class BatchRunTab(QWidget):
         self.overall_progress_bar.setMaximum(100)
         self.overall_progress_bar.setValue(0)
         self.overall_progress_bar.setFormat("Overall Progress: 0%")
+        self._last_overall_pct = 0
         self.overall_progress_bar.style().unpolish(self.overall_progress_bar)
         self.overall_progress_bar.style().polish(self.overall_progress_bar)
         self.overall_progress_bar.update()
@@ -254,7 +294,7 @@ class BatchRunTab(QWidget):
             "converge_n": iterations,
             'init_method': 'col_means',
             'init_norm': False,
-            "progress_callback": self.progress_callback
+            "progress_callback": self._enqueue_progress
         }
 
         # Get selected dataset
@@ -264,24 +304,26 @@ class BatchRunTab(QWidget):
                                 "Please load and select a dataset before running a batch model.")
             return
 
+        self._progress_queue.clear()
+        self._flush_timer.start()
+
         # Call run_batch on the controller
-        batchsa_manager = self.controller.main_controller.run_batch(dataset, **params)
+        try:
+            batchsa_manager = self.controller.main_controller.run_batch(dataset, **params)
+        except Exception as e:
+            self._on_batch_error("BatchSA", e)
+            return
         logger.info(f"BatchSAManager: {batchsa_manager}")
         if batchsa_manager:
-            batchsa_manager.progress.connect(self.progress_callback)
+            # Progress is emitted from the listener thread, only queue it here and leave the table to the flush timer
+            batchsa_manager.progress.connect(self._enqueue_progress, Qt.QueuedConnection)
+            batchsa_manager.error.connect(self._on_batch_error, Qt.QueuedConnection)
         else:
             logger.error("BatchSAManager is None!")
 
-        # Connect the progress signal to the callback
-        batchsa_manager.progress.connect(self.progress_callback)
-        self.all_models_completed.connect(lambda: QTimer.singleShot(200, self.batch_model_finish))
-
-        # Connect the finished signal to the main controller's method
-        self.controller.main_controller.batchsa_finished.connect(lambda: self.controller.main_controller.run_batch_analysis(dataset))
-
         self.basemodel_progress_table.setUpdatesEnabled(True)
 
-    def progress_callback(self, progress_data):
+    def _enqueue_progress(self, progress_data):
         """
         Expects progress_data as a dict:
         {
@@ -294,113 +336,101 @@ class BatchRunTab(QWidget):
             "completed": bool
         }
         """
+        self._progress_queue.append(progress_data)
+
+    def _flush_pending(self):
+        """Apply the queued progress updates to the table and overall progress bar."""
+        if not self._progress_queue:
+            return
 
         if hasattr(self, "info_dialog"):
             self.info_dialog.close()
             del self.info_dialog
 
-        model_i = progress_data["model_i"]
-        i = progress_data["i"]
-        max_iter = progress_data["max_iter"]
-        qtrue = progress_data["qtrue"]
-        qrobust = progress_data["qrobust"]
-        mse = progress_data["mse"]
-
-        now = time.monotonic()
-        min_interval = 1 / 60
-
-        if model_i not in self._last_update_time:
-            self._last_update_time[model_i] = 0
-
-        elapsed = now - self._last_update_time[model_i]
-        update_now = (elapsed > min_interval) or (i == max_iter) or progress_data.get("completed", False)
-
-        if not update_now:
-            pass
-
-        self._last_update_time[model_i] = now
-
-        progress_bar, row, converged_label = self.model_progress_widgets[model_i]
-        progress_bar.setValue(i)
-
-        self.basemodel_progress_table.item(row, 2).setText(f"{qtrue:.4f}")
-        self.basemodel_progress_table.item(row, 3).setText(f"{qrobust:.4f}")
-        self.basemodel_progress_table.item(row, 4).setText(f"{mse:.4f}")
-
-        if i >= max_iter or progress_data.get("completed", False):
-            converged = i < max_iter
-            converged_label.setText("Yes" if converged else "No")
-            self.basemodel_progress_table.mark_row_completed(row)
+        # Coalesce the queued events, only the latest one per model is applied
+        pending = {}
+        while self._progress_queue:
+            progress_data = self._progress_queue.popleft()
+            pending[progress_data["model_i"]] = progress_data
+
+        # Block the item model's per-cell dataChanged signals and repaint the viewport once instead
+        with QSignalBlocker(self.basemodel_progress_table.model()):
+            for model_i, progress_data in pending.items():
+                i = progress_data["i"]
+                max_iter = progress_data["max_iter"]
+                qtrue = progress_data["qtrue"]
+                qrobust = progress_data["qrobust"]
+                mse = progress_data["mse"]
+                completed = progress_data.get("completed", False)
+                (progress_item, row, converged_label, qtrue_item, qrobust_item, mse_item,
+                 last_text) = self.model_progress_widgets[model_i]
+                progress_item.setData(Qt.UserRole, i)
+                self._progress[model_i - 1] = i
+                self._qtrue[model_i - 1] = qtrue
+                self._qrobust[model_i - 1] = qrobust
+                self._mse[model_i - 1] = mse
+
+                # Skip setText when the formatted value has not changed, common once a model plateaus
+                for k, (item, text) in enumerate(zip((qtrue_item, qrobust_item, mse_item),
+                                                     (f"{qtrue:.4f}", f"{qrobust:.4f}", f"{mse:.4f}"))):
+                    if text != last_text[k]:
+                        item.setText(text)
+                        last_text[k] = text
+
+                if i >= max_iter or completed:
+                    converged = i < max_iter
+                    converged_label.setText("Yes" if converged else "No")
+                    self.basemodel_progress_table.mark_row_completed(row)
+                    self._completed[model_i - 1] = True
+        self.basemodel_progress_table.viewport().update()
 
         # Update the overall progress bar
-        completed_models = 0
-        total_models = len(self.model_progress_widgets)
+        total_models = self._total_models
         if total_models > 0:
-            percent_sum = 0
-            for progress_bar, _, converged_label in self.model_progress_widgets.values():
-                if converged_label.text():  # Completed
-                    completed_models += 1
-                    percent_sum += 100
-                else:  # Incomplete
-                    percent_sum += (progress_bar.value() / progress_bar.maximum()) * 100
-            overall_percent = percent_sum / total_models
-            self.overall_progress_bar.setValue(int(overall_percent))
-            self.overall_progress_bar.setFormat(f"Overall Progress: {int(overall_percent)}%")
+            # Completed models count as max_iter, incomplete ones by their current iteration
+            done_iters = self._completed.sum() * self._max_iter + self._progress[~self._completed].sum()
+            overall_percent = done_iters / (total_models * self._max_iter) * 100
+            pct = int(overall_percent)
         else:
-            self.overall_progress_bar.setValue(0)
-            self.overall_progress_bar.setFormat("Overall Progress: 0%")
+            pct = 0
+        # Only touch the bar when the displayed integer percent changes
+        if pct != self._last_overall_pct:
+            self.overall_progress_bar.setValue(pct)
+            self.overall_progress_bar.setFormat(f"Overall Progress: {pct}%")
+            self._last_overall_pct = pct
 
         # Emit signal if all models are complete
-        if completed_models == total_models and total_models > 0 and not self._batch_completed:
+        if total_models > 0 and self._completed.all() and not self._batch_completed:
             self._batch_completed = True
-            QApplication.processEvents()  # Flush event queue before final update
             self.all_models_completed.emit()
 
+    def _on_all_models_completed(self):
+        QTimer.singleShot(200, self.batch_model_finish)
+
     def batch_model_finish(self):
         logger.info("Batch model run completed, processing results...")
-        QApplication.processEvents()  # Flush event queue
-        # 1. Extract all data as text, converting Progress to "iterations/max_iterations"
-        min_qtrue = float('inf')
-        best_row = -1
-        table_data = []
+        self._flush_timer.stop()
+        # 1. Build the table rows as text from the progress arrays, converting Progress to "iterations/max_iterations"
         max_progress = self.max_iterations_edit.text()
-        for model_i, (progress_bar, row, converged_label) in self.model_progress_widgets.items():
-            row_data = []
-            # Model label
-            row_data.append(model_i)
-            # Progress as "iterations/max_iterations"
-            progress = progress_bar.value()
-            row_data.append(f"{progress}/{max_progress}")
-            # Q(True), Q(Robust), MSE
-            for col in range(2, 5):
-                item = self.basemodel_progress_table.item(row, col).text()
-                row_data.append(item)
-            # Converged
-            row_data.append(converged_label.text())
-            table_data.append(row_data)
-            try:
-                qtrue = float(row_data[2])
-                if qtrue < min_qtrue:
-                    min_qtrue = qtrue
-                    best_row = len(table_data) - 1
-            except ValueError:
-                continue
+        table_data = [
+            [model_i, f"{self._progress[k]}/{max_progress}", f"{self._qtrue[k]:.4f}", f"{self._qrobust[k]:.4f}",
+             f"{self._mse[k]:.4f}", converged_label.text()]
+            for k, (model_i, (_, _, converged_label, *_)) in enumerate(self.model_progress_widgets.items())
+        ]
+        best_row = int(np.nanargmin(self._qtrue)) if np.isfinite(self._qtrue).any() else -1
         QTimer.singleShot(100, lambda: self.completed_batch_table(table_data, best_row))
         dataset = self.dataset_selection_widget.selected_dataset
         self.parent._model_table_data[dataset] = table_data
 
-        if best_row >= 0:
+        # Populate without firing currentIndexChanged per item, the best row is selected by completed_batch_table.
+        # The index is reset to -1 so that selection always emits, even when the best model is the first one.
+        with QSignalBlocker(self.parent.model_dropdown):
             self.parent.model_dropdown.clear()
-            self.parent.model_dropdown.addItems([f"Model {row[0]}" for row in table_data])
-            self.parent.model_dropdown.setEnabled(True)
-        else:
-            self.parent.model_dropdown.clear()
-            self.parent.model_dropdown.setEnabled(False)
-
-        self.basemodel_progress_table.rowClicked.connect(self.on_row_clicked)
-        self.parent.model_dropdown.currentIndexChanged.connect(self.parent.on_model_changed)
+            if best_row >= 0:
+                self.parent.model_dropdown.addItems([f"Model {row[0]}" for row in table_data])
+                self.parent.model_dropdown.setCurrentIndex(-1)
+        self.parent.model_dropdown.setEnabled(best_row >= 0)
 
-        self.controller.main_controller.batchanalysis_finished.connect(self.parent._update_batchanalysis_tab)
         self._restore_run_button()
 
     def completed_batch_table(self, table_data, best_row=-1):
@@ -408,36 +438,39 @@ class BatchRunTab(QWidget):
         logger.info(f"Best model: {best_row+1} with Q(True) value: {table_data[best_row][2] if best_row >= 0 else 'N/A'}")
 
         self.overall_progress_bar.setVisible(False)
-        # 2. Clear and repopulate table with QTableWidgetItems only
+        # 2. Clear and repopulate table with QTableWidgetItems only. Rows map to model dropdown indices, so they
+        # are kept in model order.
+        self.basemodel_progress_table.setUpdatesEnabled(False)
         self.basemodel_progress_table.setRowCount(0)
+        self.basemodel_progress_table.setRowCount(len(table_data))
         self.basemodel_progress_table.setHorizontalHeaderLabels([
             "Model", "Iterations", "Q(True)", "Q(Robust)", "MSE", "Converged"
         ])
+        # Cells are cloned from preconfigured prototypes rather than setting flags, alignment and font per item
+        prototype = QTableWidgetItem()
+        prototype.setFlags(prototype.flags() & ~Qt.ItemIsEditable)
+        prototype.setTextAlignment(Qt.AlignCenter)
+        best_prototype = prototype.clone()
+        font = best_prototype.font()
+        font.setBold(True)
+        best_prototype.setFont(font)
         for i, row_data in enumerate(table_data):
-            self.basemodel_progress_table.insertRow(i)
-
+            row_prototype = best_prototype if i == best_row else prototype
             for col, value in enumerate(row_data):
-                if col == 0:
-                    value = f"Model {value}"
-                item = QTableWidgetItem(value)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                item.setTextAlignment(Qt.AlignCenter)
-                font = item.font()
-                if i == best_row:
-                    font.setBold(True)
-                item.setFont(font)
+                item = row_prototype.clone()
+                item.setText(f"Model {value}" if col == 0 else value)
                 self.basemodel_progress_table.setItem(i, col, item)
+        self.basemodel_progress_table.setUpdatesEnabled(True)
 
         self.basemodel_progress_table._selected_row = best_row
 
-        # 3. Set custom delegate to draw border around best row
+        # 3. Set custom delegate to draw border around best row, the Iterations column is plain text again
+        self.basemodel_progress_table.setItemDelegateForColumn(1, None)
         delegate = BestRowDelegate(best_row, self.basemodel_progress_table)
         self.basemodel_progress_table.setItemDelegate(delegate)
         self.basemodel_progress_table._hovered_row = -1
         self.basemodel_progress_table.viewport().update()
         self.basemodel_progress_table.setMouseTracking(True)
-        self.basemodel_progress_table.rowClicked.connect(self.on_row_clicked)
-        self.basemodel_progress_table.rowDoubleClicked.connect(self.on_row_doubleclicked)
 
         # Highligh best row
         if best_row >= 0:
@@ -454,40 +487,22 @@ class BatchRunTab(QWidget):
 
     def _set_cancel_button(self):
         self.run_button.setText("Cancel")
-        self.run_button.setStyleSheet("""
-            QPushButton {
-                background-color: #F44336;
-                color: white;
-                font-size: 13px;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 10px;
-                min-width: 60px;
-            }
-            QPushButton:hover {
-                background-color: #B71C1C;
-                box-shadow: 0 0 6px #FFCDD2;
-            }
-        """)
+        self.run_button.setStyleSheet(self.CANCEL_BUTTON_STYLE)
         self.run_button.clicked.disconnect()
         self.run_button.clicked.connect(self._restore_run_button)
 
+    def _on_batch_error(self, source, exception):
+        logger.error(f"{source} run failed: {exception}")
+        if hasattr(self, "info_dialog"):
+            self.info_dialog.close()
+            del self.info_dialog
+        self._restore_run_button()
+        self.basemodel_progress_table.setUpdatesEnabled(True)
+        QMessageBox.critical(self, "Batch Error", f"An error occurred during batch processing:\n{exception}")
+
     def _restore_run_button(self):
+        self._flush_timer.stop()
         self.run_button.setText("Run")
-        self.run_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-size: 13px;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 10px;
-                min-width: 60px;
-            }
-            QPushButton:hover {
-                background-color: #388E3C;
-                box-shadow: 0 0 6px #A5D6A7;
-            }
-        """)
+        self.run_button.setStyleSheet(self.RUN_BUTTON_STYLE)
         self.run_button.clicked.disconnect()
         self.run_button.clicked.connect(self._on_run_batch_model)
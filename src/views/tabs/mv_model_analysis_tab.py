@@ -1,4 +1,5 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget
+from PySide6.QtCore import QSignalBlocker
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget, QStackedLayout
 
 from src.views.tabs.ma_featureanalysis_stab import FeatureAnalysisSubTab
 from src.views.tabs.ma_residualanalysis_stab import ResidualAnalysisSubTab
@@ -7,6 +8,11 @@ from src.views.tabs.ma_factorsummary_stab import FactorSummarySubTab
 
 
 class ModelAnalysisTab(QWidget):
+    FEATURE_ANALYSIS = 0
+    RESIDUAL_ANALYSIS = 1
+    FACTOR_ANALYSIS = 2
+    FACTOR_SUMMARY = 3
+
     def __init__(self, parent=None, controller=None, webviews=None):
         super().__init__(parent)
         self.parent = parent
@@ -25,32 +31,96 @@ class ModelAnalysisTab(QWidget):
                 color: black;
             }
         ''')
-        self.feature_analysis_tab = FeatureAnalysisSubTab(parent=self, controller=self.controller, webviews={
-            'obs_pred_scatter': self.webviews["obs_pred_scatter"],
-            'obs_pred_ts': self.webviews["obs_pred_ts"]
-        })
-        self.residual_analysis_tab = ResidualAnalysisSubTab(parent=self, controller=self.controller, webviews={
-            'residual_histogram': self.webviews["residual_histogram"],
-        })
-        self.factor_analysis_tab = FactorAnalysisSubTab(parent=self, controller=self.controller,
-                                                        webviews={
-                                                            'profile_plot': self.webviews["profile_plot"],
-                                                            'contrib_plot': self.webviews["contrib_plot"],
-                                                            'factor_fingerprints': self.webviews["factor_fingerprints"],
-                                                            'g_plot': self.webviews["g_plot"]
-                                                        })
-        self.factor_summary_tab = FactorSummarySubTab(parent=self, controller=self.controller,
-                                                      webviews={
-                                                          'factor_profiles': self.webviews["factor_profiles"],
-                                                            'factor_contributions': self.webviews["factor_contributions"],
-                                                      })
-        self.subtabs.addTab(self.feature_analysis_tab, "Feature Analysis")
-        self.subtabs.addTab(self.residual_analysis_tab, "Residual Analysis")
-        self.subtabs.addTab(self.factor_analysis_tab, "Factor Analysis")
-        self.subtabs.addTab(self.factor_summary_tab, "Factor Summary")
+        # Subtabs are built on first use; until then each index holds an empty placeholder
+        self._factories = {
+            self.FEATURE_ANALYSIS: ("Feature Analysis", FeatureAnalysisSubTab, ('obs_pred_scatter', 'obs_pred_ts')),
+            self.RESIDUAL_ANALYSIS: ("Residual Analysis", ResidualAnalysisSubTab, ('residual_histogram',)),
+            self.FACTOR_ANALYSIS: ("Factor Analysis", FactorAnalysisSubTab, (
+                'profile_plot', 'contrib_plot', 'factor_fingerprints', 'g_plot')),
+            self.FACTOR_SUMMARY: ("Factor Summary", FactorSummarySubTab, ('factor_profiles', 'factor_contributions')),
+        }
+        self._built = {}
+        # Subtabs built while hidden, whose shared webviews were handed back and still need reattaching
+        self._detached = set()
+        for idx in sorted(self._factories):
+            self.subtabs.addTab(QWidget(), self._factories[idx][0])
+        self.subtabs.currentChanged.connect(self._maybe_build)
         layout.addWidget(self.subtabs)
 
+    def _subset_webviews(self, *names):
+        return {name: self.webviews[name] for name in names}
+
+    def _build(self, idx):
+        """
+        Construct the subtab at idx. Construction moves its webviews into the subtab's layouts, and the webviews are
+        shared with other views; when this tab is hidden (e.g. built from a finished-analysis signal while DataView is
+        on screen) each webview is returned to the stacked layout it was taken from until the subtab is displayed.
+        """
+        _, subtab_cls, names = self._factories[idx]
+        webviews = self._subset_webviews(*names)
+        homes = []
+        if not self.isVisible():
+            for webview in webviews.values():
+                owner = webview.parentWidget()
+                stack = owner.layout() if owner is not None else None
+                if isinstance(stack, QStackedLayout) and stack.indexOf(webview) >= 0:
+                    homes.append((webview, stack, stack.indexOf(webview), stack.currentIndex()))
+        tab = subtab_cls(parent=self, controller=self.controller, webviews=webviews)
+        for webview, stack, index, current in homes:
+            stack.insertWidget(index, webview)
+            stack.setCurrentIndex(current)
+        if homes:
+            self._detached.add(idx)
+        return tab
+
+    def _subtab(self, idx):
+        """Return the subtab at idx, building it and swapping out its placeholder on first access."""
+        tab = self._built.get(idx)
+        if tab is None:
+            title = self._factories[idx][0]
+            tab = self._build(idx)
+            self._built[idx] = tab
+            current = self.subtabs.currentIndex()
+            placeholder = self.subtabs.widget(idx)
+            # removeTab shifts the current index; keep currentChanged quiet while the tab is swapped
+            with QSignalBlocker(self.subtabs):
+                self.subtabs.removeTab(idx)
+                self.subtabs.insertTab(idx, tab, title)
+                self.subtabs.setCurrentIndex(current)
+            placeholder.deleteLater()
+        return tab
+
+    def _maybe_build(self, idx):
+        if idx in self._factories:
+            tab = self._subtab(idx)
+            if idx in self._detached:
+                self._detached.discard(idx)
+                tab.reattach_webviews()
+
+    def showEvent(self, event):
+        # currentChanged does not fire for the initially selected subtab
+        self._maybe_build(self.subtabs.currentIndex())
+        super().showEvent(event)
+
+    @property
+    def feature_analysis_tab(self):
+        return self._subtab(self.FEATURE_ANALYSIS)
+
+    @property
+    def residual_analysis_tab(self):
+        return self._subtab(self.RESIDUAL_ANALYSIS)
+
+    @property
+    def factor_analysis_tab(self):
+        return self._subtab(self.FACTOR_ANALYSIS)
+
+    @property
+    def factor_summary_tab(self):
+        return self._subtab(self.FACTOR_SUMMARY)
+
     def reattach_webviews(self):
-        self.feature_analysis_tab.reattach_webviews()
-        self.residual_analysis_tab.reattach_webviews()
-        self.factor_analysis_tab.reattach_webviews()
+        # Subtabs that have not been built yet attach their webviews when they are created
+        for idx in (self.FEATURE_ANALYSIS, self.RESIDUAL_ANALYSIS, self.FACTOR_ANALYSIS):
+            if idx in self._built:
+                self._detached.discard(idx)
+                self._built[idx].reattach_webviews()
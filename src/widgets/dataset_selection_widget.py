@@ -1,20 +1,103 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QComboBox, QGroupBox, QSizePolicy
-from PySide6.QtCore import Qt, Signal
+import logging
+import traceback
+from functools import partial
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QComboBox, QGroupBox, QSizePolicy, QListView
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QStringListModel, QObject, QRunnable, QThreadPool, QSignalBlocker
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+
+def _set_if_changed(label, text):
+    """setText only when the text differs, avoiding a needless relayout and repaint of the label."""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _dataset_details(dataset):
+    """Format the detail label values for a loaded dataset. Runs on a QThreadPool worker."""
+    files = [getattr(dataset, "input_path", "N/A"), getattr(dataset, "uncertainty_path", "N/A")]
+    n_samples = getattr(dataset, "input_data", None)
+    n_samples = n_samples.shape[0] if n_samples is not None else "N/A"
+    n_features = getattr(dataset, "input_data", None)
+    n_features = n_features.shape[1] if n_features is not None else "N/A"
+    input_data = getattr(dataset, "input_data", None)
+
+    # Remove rows that are empty or all NaN
+    if input_data is not None and isinstance(input_data, pd.DataFrame):
+        input_data = input_data.dropna(how='all')
+
+    if input_data is not None and hasattr(input_data, "index") and len(input_data.index):
+        idx = input_data.index
+        # Only an unsorted DatetimeIndex needs the O(n) min/max scan, every other index reads its ends
+        if not isinstance(idx, pd.DatetimeIndex) or idx.is_monotonic_increasing:
+            date_range = f"{idx[0]} - {idx[-1]}"
+        elif idx.is_monotonic_decreasing:
+            date_range = f"{idx[-1]} - {idx[0]}"
+        else:
+            date_range = f"{idx.min()} - {idx.max()}"
+    else:
+        date_range = "N/A"
+    location = getattr(dataset, "loc_cols", [])
+    location = location if location else "N/A"
+
+    # "Files": "\n".join(map(str, files))
+    return {
+        "Samples": str(n_samples),
+        "Features": str(n_features),
+        "Date/Index Range": str(date_range),
+        "Location": str(location),
+    }
+
+
+class _DatasetDetailsSignals(QObject):
+    finished = Signal(object)
+
+
+class _DatasetDetailsTask(QRunnable):
+    def __init__(self, dataset, on_done):
+        super().__init__()
+        self.dataset = dataset
+        self.signals = _DatasetDetailsSignals()
+        self.signals.finished.connect(on_done)
+
+    def run(self):
+        try:
+            details = _dataset_details(self.dataset)
+        except Exception:
+            logger.error(traceback.format_exc())
+            details = None
+        self.signals.finished.emit(details)
+
 
 class DatasetSelectionWidget(QWidget):
     dataset_selected = Signal(str)
+    dropdown_updated = Signal()
 
     def __init__(self, controller=None, parent=None):
         super().__init__(parent)
         self.controller = controller
+        self._dataset_manager = self._get_dataset_manager()
         self.selected_dataset = None
         self.dataset_details_labels = {}
+        # Details are computed once per dataset name and only while the widget is visible
+        self._details_cache = {}
+        self._pending_details = None
+        # Bursts of datasets_changed within one event loop pass collapse into a single dropdown rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        # Uncached details are computed on the next event loop pass, so a quick run of selections only computes the last
+        self._details_timer = QTimer(self)
+        self._details_timer.setSingleShot(True)
+        self._details_timer.setInterval(0)
+        # Tags each details computation so results for a superseded selection are dropped
+        self._details_seq = 0
 
         self._setup_ui()
         self._connect_signals()
-        self.update_dataset_dropdown()
+        self._do_update_dropdown()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -38,6 +121,14 @@ class DatasetSelectionWidget(QWidget):
 
         # Add dropdown without label
         self.dataset_dropdown = QComboBox()
+        # Names live in a string list model, replaced with one reset, and the popup lays out uniform rows in batches
+        self._dataset_model = QStringListModel(self)
+        self.dataset_dropdown.setModel(self._dataset_model)
+        dropdown_view = QListView(self.dataset_dropdown)
+        dropdown_view.setUniformItemSizes(True)
+        dropdown_view.setLayoutMode(QListView.Batched)
+        dropdown_view.setBatchSize(50)
+        self.dataset_dropdown.setView(dropdown_view)
         selection_layout.addWidget(self.dataset_dropdown)
 
         # Add dataset details below dropdown
@@ -56,30 +147,61 @@ class DatasetSelectionWidget(QWidget):
         layout.addWidget(self.selection_group)
 
     def _connect_signals(self):
-        self.dataset_dropdown.currentIndexChanged.connect(self._on_dataset_changed)
-        dataset_manager = self._get_dataset_manager()
-        if dataset_manager:
-            dataset_manager.datasets_changed.connect(self.update_dataset_dropdown)
-            dataset_manager.dataset_loaded.connect(self.on_dataset_loaded)
+        self._refresh_timer.timeout.connect(self._do_update_dropdown)
+        self._details_timer.timeout.connect(self._apply_pending_details)
+        self.dataset_dropdown.currentIndexChanged.connect(self._on_dataset_changed, Qt.UniqueConnection)
+        if self._dataset_manager:
+            # UniqueConnection keeps a repeated _connect_signals() from double-wiring the manager slots
+            self._dataset_manager.datasets_changed.connect(self.update_dataset_dropdown, Qt.UniqueConnection)
+            self._dataset_manager.dataset_loaded.connect(self.on_dataset_loaded, Qt.UniqueConnection)
 
     def _get_dataset_manager(self):
         if self.controller and hasattr(self.controller, "main_controller"):
             return getattr(self.controller.main_controller, "dataset_manager", None)
         return None
 
+    @Slot()
     def update_dataset_dropdown(self):
-        self.dataset_dropdown.blockSignals(True)
-        self.dataset_dropdown.clear()
-        dataset_manager = self._get_dataset_manager()
+        """Schedule a dropdown rebuild on the next event loop pass."""
+        self._refresh_timer.start()
+
+    def _do_update_dropdown(self):
+        dataset_manager = self._dataset_manager
+        names = []
         if dataset_manager and hasattr(dataset_manager, "get_names"):
             names = dataset_manager.get_names()
-            self.dataset_dropdown.addItems(names)
-            if names:
-                self.dataset_dropdown.setCurrentIndex(0)
-        self.dataset_dropdown.blockSignals(False)
-        if self.dataset_dropdown.count() > 0:
-            self._on_dataset_changed(0)
+        current = self._dataset_model.stringList()
+        if current != names:
+            previous = self.dataset_dropdown.currentText()
+            # Keep the selected dataset if it survived, without re-running the selection cascade
+            keep_selection = previous in names
+            with QSignalBlocker(self.dataset_dropdown):
+                self._apply_name_diff(current, names)
+                if keep_selection:
+                    self.dataset_dropdown.setCurrentIndex(names.index(previous))
+                elif names:
+                    self.dataset_dropdown.setCurrentIndex(0)
+            if not keep_selection and self.dataset_dropdown.count() > 0:
+                self._on_dataset_changed(0)
+        self.dropdown_updated.emit()
 
+    def _apply_name_diff(self, current, names):
+        """Remove and insert only the names that changed, falling back to a full reset if the order differs."""
+        removed = set(current).difference(names)
+        for name in removed:
+            self._details_cache.pop(name, None)
+        for row in reversed(range(len(current))):
+            if current[row] in removed:
+                self._dataset_model.removeRows(row, 1)
+        existing = set(current)
+        for row, name in enumerate(names):
+            if name not in existing:
+                self._dataset_model.insertRows(row, 1)
+                self._dataset_model.setData(self._dataset_model.index(row), name)
+        if self._dataset_model.stringList() != names:
+            self._dataset_model.setStringList(names)
+
+    @Slot(int)
     def _on_dataset_changed(self, idx):
         name = self.dataset_dropdown.currentText()
         self.selected_dataset = name
@@ -87,47 +209,57 @@ class DatasetSelectionWidget(QWidget):
         self.dataset_selected.emit(name)
 
     def update_dataset_details(self, dataset_name):
-        dataset_manager = self._get_dataset_manager()
+        self._pending_details = dataset_name
+        if not self.isVisible():
+            # Hidden widgets defer the work until showEvent
+            return
+        if dataset_name in self._details_cache:
+            self._apply_pending_details()
+        else:
+            self._details_timer.start()
+
+    def _apply_pending_details(self):
+        dataset_name = self._pending_details
+        self._pending_details = None
+        if dataset_name is None:
+            return
+        self._details_seq += 1
+        details = self._details_cache.get(dataset_name)
+        if details is not None:
+            self._set_details(details)
+            return
         dataset = None
-        if dataset_manager:
-            if dataset_name in dataset_manager.loaded_datasets.keys():
-                dataset = dataset_manager.loaded_datasets.get(dataset_name)
+        if self._dataset_manager and dataset_name in self._dataset_manager.loaded_datasets.keys():
+            dataset = self._dataset_manager.loaded_datasets.get(dataset_name)
         if not dataset:
-            for v in self.dataset_details_labels.values():
-                v.setText("-")
+            self._set_details(None)
             return
+        # Formatting walks the DataFrame (dropna, index range), keep it off the GUI thread
+        task = _DatasetDetailsTask(dataset, partial(self._on_details_ready, self._details_seq, dataset_name))
+        QThreadPool.globalInstance().start(task)
 
-        files = [getattr(dataset, "input_path", "N/A"), getattr(dataset, "uncertainty_path", "N/A")]
-        n_samples = getattr(dataset, "input_data", None)
-        n_samples = n_samples.shape[0] if n_samples is not None else "N/A"
-        n_features = getattr(dataset, "input_data", None)
-        n_features = n_features.shape[1] if n_features is not None else "N/A"
-        input_data = getattr(dataset, "input_data", None)
-
-        # Remove rows that are empty or all NaN
-        if input_data is not None and isinstance(input_data, pd.DataFrame):
-            input_data = input_data.dropna(how='all')
-
-        if input_data is not None and hasattr(input_data, "index"):
-            idx = input_data.index
-            if isinstance(idx, int) or isinstance(idx, pd.Timestamp) or isinstance(idx, pd.DatetimeIndex):
-                if hasattr(idx, "min") and hasattr(idx, "max"):
-                    date_range = f"{idx.min()} - {idx.max()}"
-                else:
-                    date_range = "N/A"
-            else:
-                date_range = f"{idx[0]} - {idx[-1]}"
-        else:
-            date_range = "N/A"
-        location = getattr(dataset, "loc_cols", [])
-        location = location if location else "N/A"
+    def _on_details_ready(self, seq, dataset_name, details):
+        if seq != self._details_seq:
+            return  # A newer selection has been requested since
+        if details is not None:
+            self._details_cache[dataset_name] = details
+        self._set_details(details)
+
+    def _set_details(self, details):
+        if details is None:
+            for v in self.dataset_details_labels.values():
+                _set_if_changed(v, "-")
+            return
+        for key, value in details.items():
+            _set_if_changed(self.dataset_details_labels[key], value)
 
-        # self.dataset_details_labels["Files"].setText("\n".join(map(str, files)))
-        self.dataset_details_labels["Samples"].setText(str(n_samples))
-        self.dataset_details_labels["Features"].setText(str(n_features))
-        self.dataset_details_labels["Date/Index Range"].setText(str(date_range))
-        self.dataset_details_labels["Location"].setText(str(location))
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_details is not None:
+            self.update_dataset_details(self._pending_details)
 
+    @Slot(str)
     def on_dataset_loaded(self, dataset_name):
+        self._details_cache.pop(dataset_name, None)
         if dataset_name == self.dataset_dropdown.currentText():
             self.update_dataset_details(dataset_name)
\ No newline at end of file
@@ -1,30 +1,87 @@
-from PySide6.QtWidgets import QTableWidget, QAbstractItemView, QStyledItemDelegate
-from PySide6.QtCore import Signal
-from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtWidgets import (QTableWidget, QAbstractItemView, QStyledItemDelegate, QStyleOptionProgressBar, QStyle,
+                               QApplication)
+from PySide6.QtCore import Qt, Signal, Slot, QRect, QVariantAnimation
+from PySide6.QtGui import QColor, QBrush, QPen, QPalette
 
+# Parsed once and shared by every table instance
+_HOVER_COLOR = QColor("#2196F3")  # Light blue for hover
+_DEFAULT_SELECTION_COLOR = QColor("#ADD8E6")
+_DEFAULT_COMPLETED_COLOR = QColor("#43A047")  # Green for completed rows
 
 class HoverableTableWidget(QTableWidget):
     rowClicked = Signal(int)
     rowHovered = Signal(int)
     rowDoubleClicked = Signal(int)
 
-    def __init__(self, *args, selection_color="#ADD8E6", completed_color="#43A047", **kwargs):
+    def __init__(self, *args, selection_color=None, completed_color=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.setMouseTracking(True)
         self._hovered_row = -1
         self._selected_row = -1
-        self.completed_rows = set()  # Track completed rows
-        self.hover_color = QColor("#2196F3")  # Light blue for hover
-        self.selection_color = QColor(selection_color)
-        self.completed_color = QColor(completed_color)  # Green for completed rows
+        self._completed_mask = 0  # Bit n is set once row n has completed
+        self.hover_color = _HOVER_COLOR
+        self.selection_color = QColor(selection_color) if selection_color is not None else _DEFAULT_SELECTION_COLOR
+        self.completed_color = QColor(completed_color) if completed_color is not None else _DEFAULT_COMPLETED_COLOR
+        # A single animation fades the hover highlight in, each frame is one viewport update
+        self._hover_fill = QColor(self.hover_color)
+        self._hover_anim = QVariantAnimation(self)
+        self._hover_anim.setDuration(150)
+        self._hover_anim.setStartValue(0)
+        self._hover_anim.setEndValue(self.hover_color.alpha())
+        self._hover_anim.valueChanged.connect(self._on_hover_anim_value)
+        # Brushes for the row fills are built once so painting does not construct one per fillRect
+        self._completed_brush = QBrush(self.completed_color)
+        self._selection_brush = QBrush(self.selection_color)
+        self._hover_brush = QBrush(self._hover_fill)
+        # Row y offsets and heights in content coordinates, rebuilt lazily after rows are added, removed or resized
+        self._row_y = []
+        self._row_h = []
+        self._row_geometry_valid = False
+        self.verticalHeader().sectionResized.connect(self._invalidate_row_geometry)
+        self.verticalHeader().sectionCountChanged.connect(self._invalidate_row_geometry)
         self.setSelectionMode(QAbstractItemView.NoSelection)  # Disable default selection behavior
-        self.cellDoubleClicked.connect(self._on_cell_double_clicked)
+        # Row highlights are painted by the item delegate in the same pass as the cells
+        self.setItemDelegate(RowPaintDelegate(self, parent=self))
+        self.cellDoubleClicked.connect(self._on_cell_double_clicked, Qt.UniqueConnection)
 
     def mark_row_completed(self, row):
         """Mark a row as completed."""
-        self.completed_rows.add(row)
-        self.viewport().update()
+        self._completed_mask |= 1 << row
+        self._update_rows(row)
 
+    def _invalidate_row_geometry(self, *args):
+        self._row_geometry_valid = False
+
+    def _ensure_row_geometry(self):
+        if self._row_geometry_valid:
+            return
+        header = self.verticalHeader()
+        rows = range(self.rowCount())
+        self._row_y = [header.sectionPosition(row) for row in rows]
+        self._row_h = [header.sectionSize(row) for row in rows]
+        self._row_geometry_valid = True
+
+    def _row_rect(self, row):
+        """Full viewport width rect of a row, empty when the row does not exist."""
+        self._ensure_row_geometry()
+        if row < 0 or row >= len(self._row_y):
+            return QRect()
+        return QRect(0, self._row_y[row] - self.verticalOffset(), self.viewport().width(), self._row_h[row])
+
+    def _update_rows(self, *rows):
+        """Repaint only the given rows instead of the whole viewport."""
+        rect = QRect()
+        for row in rows:
+            rect = rect.united(self._row_rect(row))
+        if not rect.isEmpty():
+            self.viewport().update(rect)
+
+    def _on_hover_anim_value(self, alpha):
+        self._hover_fill.setAlpha(alpha)
+        self._hover_brush.setColor(self._hover_fill)
+        self._update_rows(self._hovered_row)
+
+    @Slot(int, int)
     def _on_cell_double_clicked(self, row, column):
         self.rowDoubleClicked.emit(row)
 
@@ -32,65 +89,119 @@ class HoverableTableWidget(QTableWidget):
         index = self.indexAt(event.pos())
         row = index.row()
         if row != self._hovered_row:
+            previous = self._hovered_row
             self._hovered_row = row
-            self.viewport().update()
+            self._hover_anim.stop()
+            self._update_rows(previous, row)
+            self._hover_anim.start()
             self.rowHovered.emit(row)
         super().mouseMoveEvent(event)
 
     def leaveEvent(self, event):
+        previous = self._hovered_row
         self._hovered_row = -1
-        self.viewport().update()
+        self._hover_anim.stop()
+        self._update_rows(previous)
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
         index = self.indexAt(event.pos())
         if index.isValid():
+            previous = self._selected_row
             if self._selected_row == index.row():
                 self._selected_row = -1  # Deselect if already selected
             else:
                 self._selected_row = index.row()
-            self.viewport().update()
+            self._update_rows(previous, index.row())
             self.rowClicked.emit(self._selected_row)
         super().mousePressEvent(event)
 
-    def paintEvent(self, event):
-        painter = QPainter(self.viewport())
-        for row in range(self.rowCount()):
-            rect = self.visualItemRect(self.item(row, 0))
-            rect.setLeft(0)
-            rect.setRight(self.viewport().width())
 
-            if row in self.completed_rows:
-                painter.fillRect(rect, self.completed_color)  # Static color for completed rows
-            elif row == self._selected_row:
-                painter.fillRect(rect, self.selection_color)
-            elif row == self._hovered_row:
-                painter.fillRect(rect, self.hover_color)
+class RowPaintDelegate(QStyledItemDelegate):
+    """Paint the HoverableTableWidget row highlight (completed, selected or hovered) behind each cell.
+
+    initStyleOption is intentionally not overridden: QTableWidget's model is implemented in C++, so Qt's per-role
+    data() lookups never reach Python, whereas a Python-side role cache would add a crossing per cell.
+    """
 
-        super().paintEvent(event)
+    def __init__(self, table, parent=None):
+        super().__init__(parent)
+        self.table = table
+
+    def row_fill(self, row):
+        table = self.table
+        if (table._completed_mask >> row) & 1:
+            return table._completed_brush  # Static color for completed rows
+        if row == table._selected_row:
+            return table._selection_brush
+        if row == table._hovered_row:
+            return table._hover_brush
+        return None
 
+    def paint_row_background(self, painter, option, index):
+        table = self.table
+        if not table._completed_mask and table._selected_row < 0 and table._hovered_row < 0:
+            return  # Idle table, nothing is highlighted
+        # Each cell fills its own part of the row: Qt repaints single cells (current cell, dataChanged), so a
+        # full-row fill from column 0 alone would leave those cells unhighlighted
+        fill = self.row_fill(index.row())
+        if fill is not None:
+            painter.fillRect(option.rect, fill)
+
+    def paint(self, painter, option, index):
+        self.paint_row_background(painter, option, index)
+        super().paint(painter, option, index)
 
-class BestRowDelegate(QStyledItemDelegate):
+
+class BestRowDelegate(RowPaintDelegate):
     def __init__(self, best_row, table, border_color="#2196F3", parent=None):
-        super().__init__(parent)
+        super().__init__(table, parent)
         self.best_row = best_row
-        self.table = table
         self.border_color = border_color
+        self._border_pen = QPen(QColor(border_color), 2)
 
     def paint(self, painter, option, index):
-        # Draw the custom border for the best row
+        # Row highlight and cell content first, the border goes on top of the row fill
+        super().paint(painter, option, index)
+
+        # Draw the border around the whole best row in one call. Painting is clipped to the dirty region, so
+        # redrawing it from each cell of the row only touches pixels that are being repainted anyway.
         if index.row() == self.best_row:
-            pen = QPen(QColor(self.border_color), 2)
-            painter.save()
+            # Only the pen and brush change, so swap those back instead of saving the whole painter state
+            pen, brush = painter.pen(), painter.brush()
+            painter.setPen(self._border_pen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(self.table._row_rect(self.best_row).adjusted(1, 1, -1, -1))
             painter.setPen(pen)
-            rect = option.rect
-            painter.drawLine(rect.left(), rect.top(), rect.right(), rect.top())
-            painter.drawLine(rect.left(), rect.bottom(), rect.right(), rect.bottom())
-            if index.column() == 0:
-                painter.drawLine(rect.left(), rect.top(), rect.left(), rect.bottom())
-            if index.column() == (index.model().columnCount() - 1):
-                painter.drawLine(rect.right(), rect.top(), rect.right(), rect.bottom())
-            painter.restore()
-
-        # Call the base class's paint method to render the cell content
-        super().paint(painter, option, index)
+            painter.setBrush(brush)
+
+
+class ProgressDelegate(RowPaintDelegate):
+    """Paint a progress bar from the iteration count stored in the item's UserRole."""
+
+    def __init__(self, maximum=1, bar_height=10, chunk_color="#2196F3", parent=None):
+        super().__init__(parent, parent)
+        self.maximum = maximum
+        self.bar_height = bar_height
+        self.chunk_color = QColor(chunk_color)
+
+    def paint(self, painter, option, index):
+        value = index.data(Qt.UserRole)
+        if value is None:
+            super().paint(painter, option, index)
+            return
+        self.paint_row_background(painter, option, index)
+        rect = option.rect
+        opt = QStyleOptionProgressBar()
+        opt.rect = QRect(rect.left() + 2, rect.center().y() - self.bar_height // 2, rect.width() - 4, self.bar_height)
+        opt.minimum = 0
+        opt.maximum = self.maximum
+        opt.progress = min(value, self.maximum)
+        opt.text = f"{int(opt.progress * 100 / self.maximum)}%"
+        opt.textVisible = True
+        opt.textAlignment = Qt.AlignRight | Qt.AlignVCenter
+        opt.state = option.state | QStyle.State_Horizontal
+        palette = QPalette(option.palette)
+        palette.setColor(QPalette.Highlight, self.chunk_color)
+        opt.palette = palette
+        QApplication.style().drawControl(QStyle.CE_ProgressBar, opt, painter)